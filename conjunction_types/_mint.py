@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from typing import Any, TypeVar, get_origin, Callable
 from types import GenericAlias
+import weakref
 
 __all__ = ["mint", "get_minted_type", "get_mint_name", "get_constructor_by_name", "get_origin_type"]
 
@@ -22,8 +23,11 @@ _minted_constructors: dict[Callable, type | GenericAlias] = {}
 _minted_names: dict[str, Callable] = {}
 """Maps mint names to their constructor functions."""
 
+_mint_names_by_constructor: dict[Callable, str] = {}
+"""Reverse of `_minted_names`: maps constructor functions to their mint names."""
+
 _minted_values: dict[int, Callable] = {}
-"""Maps value id() to their minted constructor."""
+"""Maps value id() to their minted constructor (entries of weakrefable values are dropped when the value dies)."""
 
 
 def mint(name: str, typ: type[T] | GenericAlias) -> Callable[..., T]:
@@ -93,14 +97,23 @@ def mint(name: str, typ: type[T] | GenericAlias) -> Callable[..., T]:
         # Create the value
         value = base_constructor(*args, **kwargs)
 
-        # Tag it with this minted constructor (using id to avoid WeakRef issues)
-        _minted_values[id(value)] = minted_constructor
+        # Tag it with this minted constructor (using id, since lists/dicts/ints are not weakrefable)
+        value_id = id(value)
+        _minted_values[value_id] = minted_constructor
+
+        # Untag on collection where possible, so the registry does not grow without bound
+        # and a recycled id() cannot inherit this tag
+        try:
+            weakref.finalize(value, _minted_values.pop, value_id, None)
+        except TypeError:
+            pass
 
         return value
 
     # Store metadata about this constructor
     _minted_constructors[minted_constructor] = typ
     _minted_names[name] = minted_constructor
+    _mint_names_by_constructor[minted_constructor] = name
 
     # Set name for better debugging
     minted_constructor.__name__ = name
@@ -153,10 +166,11 @@ def get_mint_name(constructor: Callable) -> str | None:
     Returns:
         The mint name if found, else None
     """
-    for name, ctor in _minted_names.items():
-        if ctor is constructor:
-            return name
-    return None
+    try:
+        return _mint_names_by_constructor.get(constructor)
+    except TypeError:
+        # Unhashable objects are never minted constructors
+        return None
 
 
 def get_constructor_by_name(name: str) -> Callable | None:
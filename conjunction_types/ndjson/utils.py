@@ -9,12 +9,27 @@ the type representation and reconstructing it during deserialization.
 """
 from __future__ import annotations
 
+import functools
 import json
+import math
+import os
+import re
 from pathlib import Path
-from typing import Any, Iterator, Callable, TypeVar, get_origin
+from typing import Any, BinaryIO, Iterable, Iterator, Callable, Literal, TypeVar, Optional, Union, get_origin
 from types import GenericAlias
+import pathlib
 
-from conjunction_types import Conjunction
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the `ndjson` extra
+    orjson = None
+
+try:
+    from msgspec import msgpack
+except ImportError:  # optional, only needed for NDJSONFile(format='msgpack')
+    msgpack = None
+
+from conjunction_types import Conjunction, get_constructor_by_name, get_mint_name
 
 __all__ = [
     "ConjunctionSerializer",
@@ -34,6 +49,15 @@ _ndjson_serializers: dict[Callable, Callable[[Any], Any]] = {}
 _ndjson_deserializers: dict[str, Callable[[Any], Any]] = {}
 """Maps mint names to their custom deserializers."""
 
+_CACHE_MAX = 1024
+"""Entries a memo below keeps before it is flushed (matching the core type cache)."""
+
+_type_repr_cache: dict[type | GenericAlias, str] = {}
+"""Memoized `_serialize_type` results, keyed by the type itself (flushed at `_CACHE_MAX`)."""
+
+_schema_plan_cache: dict[tuple[Any, ...], tuple[tuple[str, str], ...]] = {}
+"""Memoized `_schema_plan` results, keyed by a Conjunction's ordered type keys (flushed at `_CACHE_MAX`)."""
+
 
 def mint(
     name: str,
@@ -94,11 +118,275 @@ def mint(
     return constructor
 
 
+def _value_keys(types: Iterable[Any]) -> list[str]:
+    """
+    Name the JSON value key for each type key, e.g. `int_0`, `list_0`, `list_1`.
+
+    Uses the base name (int, list, etc.) with a counter to handle duplicates.
+    """
+    keys = []
+    type_counts: dict[str, int] = {}
+    for typ in types:
+        base_name = getattr(typ, '__name__', None)
+        if base_name is None:
+            # For generic aliases, get the origin's name
+            origin = get_origin(typ)
+            base_name = origin.__name__ if origin else 'type'
+
+        count = type_counts.get(base_name, 0)
+        keys.append(f"{base_name}_{count}")
+        type_counts[base_name] = count + 1
+    return keys
+
+
+def _schema_plan(types: tuple[Any, ...]) -> tuple[tuple[str, str], ...]:
+    """
+    Return the `(type_repr, value_key)` pair for each type key of a schema.
+
+    Rows of the same schema share a plan, so the naming and counting in
+    `_value_keys` runs once per schema rather than once per row.
+    """
+    try:
+        return _schema_plan_cache[types]
+    except KeyError:
+        plan = tuple(zip(map(_serialize_type, types), _value_keys(types)))
+        if len(_schema_plan_cache) >= _CACHE_MAX:
+            _schema_plan_cache.clear()
+        _schema_plan_cache[types] = plan
+        return plan
+    except TypeError:
+        # Unhashable type expressions cannot be memoized
+        return tuple(zip(map(_serialize_type, types), _value_keys(types)))
+
+
+def _dumps_line(data: dict[str, Any]) -> bytes:
+    """
+    Encode one record as a newline-terminated NDJSON line.
+
+    Uses orjson when available. Lines orjson cannot encode exactly (integers
+    beyond 64 bits, or NaN/infinity, which orjson writes as `null` while the
+    stdlib encoder preserves them) are encoded with `json` instead.
+    """
+    if orjson is not None and not _has_non_finite_record(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return (json.dumps(data) + '\n').encode()
+
+
+def _has_non_finite_record(data: Any) -> bool:
+    """Check a record for NaN/infinity, skipping its type metadata (strings only)."""
+    if not isinstance(data, dict):
+        return _has_non_finite(data)
+    for key, value in data.items():
+        if value.__class__ in _FINITE_SCALAR_CLASSES or key in _METADATA_KEYS:
+            continue
+        if _has_non_finite(value):
+            return True
+    return False
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Check whether a JSON-ready value holds a NaN or infinite float anywhere."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple)):
+        return False
+    for item in value:
+        if item.__class__ in _FINITE_SCALAR_CLASSES:
+            continue
+        if _has_non_finite(item):
+            return True
+    return False
+
+
+_DIGIT_MASK = bytes(ord('0') if i in b'0123456789' else ord(' ') for i in range(256))
+"""`bytes.translate` table mapping every digit to `0` and every other byte to a space."""
+
+_LONG_DIGIT_RUN = b'0' * 19
+"""A masked digit run long enough to be an integer beyond 64 bits, which orjson decodes as a float."""
+
+
+def _loads_line(line: bytes) -> Any:
+    """
+    Decode one NDJSON line.
+
+    Falls back to `json` for NaN/Infinity literals and for lines holding a
+    long digit run, since orjson decodes integers beyond 64 bits lossily.
+    """
+    # NOTE: translate + substring test are single C passes, ~3x cheaper than a regex search
+    if orjson is not None and _LONG_DIGIT_RUN not in line.translate(_DIGIT_MASK):
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line)
+
+
+_WRITE_CHUNK_SIZE = 1 << 20
+"""Bytes of encoded lines `NDJSONFile.write_all` accumulates per write call."""
+
+
+_READ_CHUNK_SIZE = 1 << 20
+"""Bytes `NDJSONFile` reads per call when scanning a file for records."""
+
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+"""Flags for the append descriptor (`O_BINARY` keeps Windows from translating newlines)."""
+
+
+def _dumps_msgpack_record(data: dict[str, Any]) -> bytes:
+    """
+    Encode one record as a varint length prefix followed by its MessagePack payload.
+
+    MessagePack payloads can contain newline bytes, so records are framed by
+    length instead of by line.
+    """
+    payload = msgpack.encode(data)
+    size = len(payload)
+    prefix = bytearray()
+    while size >= 0x80:
+        prefix.append(size & 0x7F | 0x80)
+        size >>= 7
+    prefix.append(size)
+    return bytes(prefix) + payload
+
+
+def _iter_msgpack_records(f: BinaryIO) -> Iterator[bytes]:
+    """Yield the payloads of a length-prefixed MessagePack file, reading large chunks."""
+    # NOTE: Chunks are only joined once they can complete the record in progress,
+    # so large records cost linear rather than quadratic time
+    pending: list[bytes] = []
+    pending_size = 0
+    needed = 0
+    while chunk := f.read(_READ_CHUNK_SIZE):
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if pending_size < needed:
+            continue
+        buffer = b''.join(pending)
+        pos = 0
+        end = len(buffer)
+        needed = 0
+        while True:
+            # Decode the varint length prefix, stopping if it is cut off
+            size = shift = 0
+            i = pos
+            while i < end:
+                byte = buffer[i]
+                i += 1
+                size |= (byte & 0x7F) << shift
+                if not byte & 0x80:
+                    break
+                shift += 7
+            else:
+                break
+            if i + size > end:
+                needed = i + size - pos
+                break
+            yield buffer[i:i + size]
+            pos = i + size
+        pending = [buffer[pos:]] if pos < end else []
+        pending_size = end - pos
+    if pending:
+        raise ValueError("Truncated MessagePack record at end of file")
+
+
+def _write_line(fd: int, line: bytes) -> None:
+    """
+    Write one encoded record to an `O_APPEND` descriptor.
+
+    The whole line goes to a single `write()`, so appends from several
+    processes land intact between each other's records rather than
+    interleaving mid-line (POSIX guarantees this up to `PIPE_BUF`, and local
+    filesystems in practice for whole regular-file writes). The loop only
+    picks up after a short write, e.g. one interrupted by a signal.
+    """
+    written = os.write(fd, line)
+    while written < len(line):
+        line = line[written:]
+        written = os.write(fd, line)
+
+
+_MAYBE_BLANK_LINE = re.compile(rb'\n\s')
+"""A line starting with whitespace, the only place a blank line can hide."""
+
+
+def _iter_lines(f: BinaryIO) -> Iterator[bytes]:
+    """
+    Yield the non-blank lines of a binary file (without their newlines).
+
+    Reads large chunks and splits them in C, which is cheaper than iterating
+    the file line by line through the buffered reader.
+    """
+    # NOTE: The pieces of an unfinished line are joined once it ends, rather than
+    # re-copied with every chunk, so long lines cost linear rather than quadratic time
+    pending: list[bytes] = []
+    while chunk := f.read(_READ_CHUNK_SIZE):
+        if b'\n' not in chunk:
+            pending.append(chunk)
+            continue
+        lines = chunk.split(b'\n')
+        if pending:
+            pending.append(lines[0])
+            lines[0] = b''.join(pending)
+        pending = [lines.pop()]
+        for line in lines:
+            if line.strip():
+                yield line
+    tail = b''.join(pending)
+    if tail.strip():
+        yield tail
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+"""Types the JSON encoders write natively (subclasses included, as with `json`)."""
+
+_JSON_SCALAR_CLASSES = frozenset(_JSON_SCALARS)
+"""Exact scalar classes, for a set probe before falling back to `isinstance`."""
+
+_FINITE_SCALAR_CLASSES = frozenset((str, int, bool, type(None)))
+"""Exact scalar classes that can never hold a NaN or infinity."""
+
+_METADATA_KEYS = frozenset(("__conjunction_types__", "__header__"))
+"""Record keys holding type metadata, which is built from strings only."""
+
+_UNRESOLVED: Any = object()
+"""Sentinel for runtime types whose serializer lookup has not run yet."""
+
+
+def _is_json_native(value: Any) -> bool:
+    """
+    Check whether a value can be written as JSON as-is.
+
+    Walks lists, tuples and dicts instead of trial-encoding the value, so the
+    common scalar case is a single type check.
+    """
+    if isinstance(value, _JSON_SCALARS):
+        return True
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            if item.__class__ not in _JSON_SCALAR_CLASSES and not _is_json_native(item):
+                return False
+        return True
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if not isinstance(key, _JSON_SCALARS):
+                return False
+            if item.__class__ not in _JSON_SCALAR_CLASSES and not _is_json_native(item):
+                return False
+        return True
+    return False
+
+
 def _serialize_type(typ: type | GenericAlias) -> str:
     """
     Serialize a type (including generics) to a string representation.
 
-    Checks minted types first for stable names.
+    Checks minted types first for stable names. Results are cached per type,
+    since a type's representation never changes once it exists.
 
     Examples:
         int -> "int"
@@ -106,9 +394,24 @@ def _serialize_type(typ: type | GenericAlias) -> str:
         dict[str, list[int]] -> "dict[str, list[int]]"
         mint("MyList", list[int]) -> "MyList"
     """
+    try:
+        return _type_repr_cache[typ]
+    except KeyError:
+        type_repr = _serialize_type_uncached(typ)
+        # NOTE: Flushed rather than evicted, like the core type cache, so that
+        # generated types are not kept alive forever
+        if len(_type_repr_cache) >= _CACHE_MAX:
+            _type_repr_cache.clear()
+        _type_repr_cache[typ] = type_repr
+        return type_repr
+    except TypeError:
+        # Unhashable type expressions cannot be memoized
+        return _serialize_type_uncached(typ)
+
+
+def _serialize_type_uncached(typ: type | GenericAlias) -> str:
+    """Compute the string representation of a type; see `_serialize_type`."""
     # Check if this type was minted (typ might be a minted constructor)
-    from conjunction_types import get_mint_name
-
     mint_name = get_mint_name(typ) if callable(typ) else None
     if mint_name is not None:
         return mint_name
@@ -132,6 +435,85 @@ def _serialize_type(typ: type | GenericAlias) -> str:
     return repr(typ)
 
 
+_SAFE_NAMESPACE: dict[str, Any] = {
+    # Built-in types
+    'int': int,
+    'str': str,
+    'float': float,
+    'bool': bool,
+    'bytes': bytes,
+    'list': list,
+    'dict': dict,
+    'set': set,
+    'tuple': tuple,
+    'frozenset': frozenset,
+    # Typing constructs
+    'Any': Any,
+    'Optional': Optional,
+    'Union': Union,
+    # Common stdlib modules
+    'pathlib': pathlib,
+    'Path': Path,
+}
+"""Names available when evaluating serialized type representations."""
+
+
+_TYPE_REPR_TOKEN = re.compile(r'\s*([\w.]+|\S)')
+"""Splits a type representation into dotted names and single punctuation."""
+
+
+def _parse_type_repr(type_repr: str, namespace: dict[str, Any]) -> Any:
+    """
+    Parse a type representation without `eval`.
+
+    Handles the shapes `_serialize_type` produces: names and dotted names
+    (`int`, `pathlib.Path`), subscripts (`dict[str, list[int]]`) and unions
+    (`int | None`), plus `None` and `...`. Raises on anything else, e.g.
+    `tuple[()]`.
+    """
+    tokens = _TYPE_REPR_TOKEN.findall(type_repr)
+    pos = 0
+
+    def parse_union() -> Any:
+        nonlocal pos
+        typ = parse_subscript()
+        while pos < len(tokens) and tokens[pos] == '|':
+            pos += 1
+            typ = typ | parse_subscript()
+        return typ
+
+    def parse_subscript() -> Any:
+        nonlocal pos
+        name = tokens[pos]
+        pos += 1
+        if name == 'None':
+            typ = None
+        elif name == '...':
+            typ = ...
+        else:
+            head, *attrs = name.split('.')
+            typ = namespace[head]
+            for attr in attrs:
+                typ = getattr(typ, attr)
+
+        if pos < len(tokens) and tokens[pos] == '[':
+            pos += 1
+            args = [parse_union()]
+            while tokens[pos] == ',':
+                pos += 1
+                args.append(parse_union())
+            if tokens[pos] != ']':
+                raise ValueError(f"Expected ']' in {type_repr!r}")
+            pos += 1
+            typ = typ[args[0] if len(args) == 1 else tuple(args)]
+        return typ
+
+    typ = parse_union()
+    if pos != len(tokens):
+        raise ValueError(f"Unexpected {tokens[pos]!r} in {type_repr!r}")
+    return typ
+
+
 def _deserialize_type(type_repr: str, safe_globals: dict[str, Any] | None = None) -> type | GenericAlias:
     """
     Deserialize a type from its string representation.
@@ -140,48 +522,25 @@ def _deserialize_type(type_repr: str, safe_globals: dict[str, Any] | None = None
 
     Args:
         type_repr: String representation of the type
-        safe_globals: Optional dict of allowed names for eval
+        safe_globals: Optional dict of allowed names
 
     Returns:
         The reconstructed type
     """
     # Check if this is a minted type name
-    from conjunction_types import get_constructor_by_name
-
     constructor = get_constructor_by_name(type_repr)
     if constructor is not None:
         return constructor
 
-    # Build a safe namespace for eval
-    if safe_globals is None:
-        safe_globals = {}
+    # Build a safe namespace (user-provided globals take precedence)
+    safe_namespace = {**_SAFE_NAMESPACE, **safe_globals} if safe_globals else _SAFE_NAMESPACE
 
-    # Add common typing constructs
-    from typing import Any, Optional, Union
-    import pathlib
-
-    safe_namespace = {
-        # Built-in types
-        'int': int,
-        'str': str,
-        'float': float,
-        'bool': bool,
-        'bytes': bytes,
-        'list': list,
-        'dict': dict,
-        'set': set,
-        'tuple': tuple,
-        'frozenset': frozenset,
-        # Typing constructs
-        'Any': Any,
-        'Optional': Optional,
-        'Union': Union,
-        # Common stdlib modules
-        'pathlib': pathlib,
-        'Path': Path,
-        # User-provided globals
-        **safe_globals,
-    }
+    try:
+        return _parse_type_repr(type_repr, safe_namespace)
+    except Exception:
+        # NOTE: Anything the parser does not cover (e.g. `tuple[()]`) still
+        # goes through a builtins-free eval, as before
+        pass
 
     try:
         result = eval(type_repr, {"__builtins__": {}}, safe_namespace)
@@ -190,6 +549,22 @@ def _deserialize_type(type_repr: str, safe_globals: dict[str, Any] | None = None
         raise ValueError(f"Cannot deserialize type from repr: {type_repr}. Error: {e}")
 
 
+def _construct(typ: Callable[[Any], Any], data: Any) -> Any:
+    """Rebuild a value by calling its type on the JSON data (None stays None)."""
+    return typ(data) if data is not None else None
+
+
+def _deserialize_minted(mint_name: str, fallback: Callable[[Any], Any], data: Any) -> Any:
+    """Apply the NDJSON deserializer minted under `mint_name`, else `fallback`."""
+    deserializer = _ndjson_deserializers.get(mint_name)
+    return deserializer(data) if deserializer is not None else fallback(data)
+
+
+def _identity(data: Any) -> Any:
+    """Return JSON data as-is, for types that cannot be constructed from it."""
+    return data
+
+
 class TypeRegistry:
     """
     Registry for custom type serializers and deserializers.
@@ -203,6 +578,9 @@ class TypeRegistry:
         self._deserializers: dict[str, Callable[[Any], Any]] = {}
         self._type_aliases: dict[str, type] = {}
         self._safe_globals: dict[str, Any] = {}
+        self._type_cache: dict[str, type | GenericAlias] = {}
+        self._runtime_serializers: dict[type, Callable[[Any], Any] | None] = {}
+        self._type_deserializers: dict[type | GenericAlias, Callable[[Any], Any]] = {}
 
     def register(
         self,
@@ -222,10 +600,13 @@ class TypeRegistry:
         """
         type_name = name or typ.__name__
         self._serializers[typ] = serializer
+        self._runtime_serializers.clear()
         self._deserializers[type_name] = deserializer
+        self._type_deserializers.clear()
         self._type_aliases[type_name] = typ
         # Add to safe globals for type deserialization
         self._safe_globals[type_name] = typ
+        self._type_cache.clear()
 
     def register_type(self, name: str, typ: type) -> None:
         """
@@ -235,6 +616,32 @@ class TypeRegistry:
         """
         self._type_aliases[name] = typ
         self._safe_globals[name] = typ
+        self._type_cache.clear()
+
+    def deserialize_type(self, type_repr: str) -> type | GenericAlias:
+        """
+        Deserialize a type representation against this registry's names.
+
+        Results are memoized per representation until another type is registered.
+
+        Args:
+            type_repr: String representation of the type
+
+        Returns:
+            The reconstructed type
+        """
+        try:
+            return self._type_cache[type_repr]
+        except KeyError:
+            typ = self._type_cache[type_repr] = _deserialize_type(type_repr, self._safe_globals)
+            return typ
+
+    def _find_runtime_serializer(self, runtime_type: type) -> Callable[[Any], Any] | None:
+        """Return the first registered serializer whose type `runtime_type` subclasses."""
+        for registered_type, serializer in self._serializers.items():
+            if issubclass(runtime_type, registered_type):
+                return serializer
+        return None
 
     def serialize_value(self, value: Any, value_type: type | GenericAlias) -> Any:
         """
@@ -249,6 +656,13 @@ class TypeRegistry:
         Returns:
             JSON-serializable representation of the value
         """
+        # Fast path: a JSON scalar keyed by its own type, which the lookups below
+        # already resolved to "no serializer" (see _runtime_serializers), passes through
+        runtime_type = type(value)
+        if (runtime_type is value_type and runtime_type in _JSON_SCALAR_CLASSES
+                and self._runtime_serializers.get(runtime_type, _UNRESOLVED) is None):
+            return value
+
         # Check global NDJSON minted serializers first
         if value_type in _ndjson_serializers:
             return _ndjson_serializers[value_type](value)
@@ -265,27 +679,40 @@ class TypeRegistry:
         if check_type in self._serializers:
             return self._serializers[check_type](value)
 
-        # Check if value's runtime type has a serializer
-        runtime_type = type(value)
-        for registered_type, serializer in self._serializers.items():
-            if isinstance(value, registered_type):
-                return serializer(value)
-
-        # Try to serialize directly for JSON-compatible types
+        # Check if value's runtime type has a serializer (first registered match wins);
+        # the outcome depends only on the runtime type, so it is memoized per type
         try:
-            json.dumps(value)
-            return value
-        except (TypeError, ValueError):
-            raise TypeError(
-                f"Type {runtime_type} is not JSON-serializable. "
-                f"Register a custom serializer using TypeRegistry.register() or mint()"
-            )
+            serializer = self._runtime_serializers[runtime_type]
+        except KeyError:
+            try:
+                serializer = self._find_runtime_serializer(runtime_type)
+            except TypeError:
+                # issubclass() refused a registered type (e.g. a data protocol): scan per value
+                serializer = next(
+                    (ser for reg, ser in self._serializers.items() if isinstance(value, reg)), None
+                )
+            else:
+                self._runtime_serializers[runtime_type] = serializer
+        if serializer is not None:
+            return serializer(value)
+
+        # Pass JSON-compatible values through (circular containers recurse out)
+        try:
+            if _is_json_native(value):
+                return value
+        except RecursionError:
+            pass
+        raise TypeError(
+            f"Type {runtime_type} is not JSON-serializable. "
+            f"Register a custom serializer using TypeRegistry.register() or mint()"
+        )
 
     def deserialize_value(self, data: Any, value_type: type | GenericAlias) -> Any:
         """
         Deserialize a value from JSON format.
 
-        Checks minted deserializers first, then registry deserializers.
+        Checks minted deserializers first, then registry deserializers. The
+        function chosen for a type is memoized until another type is registered.
 
         Args:
             data: The serialized value
@@ -294,19 +721,36 @@ class TypeRegistry:
         Returns:
             Reconstructed value
         """
-        # Check global NDJSON minted deserializers first
-        # Check if value_type is a minted constructor
-        from conjunction_types import get_mint_name
-
+        # Only the lookup sits in the `try`, so errors raised by the
+        # deserializer itself propagate instead of re-running it
+        try:
+            deserialize = self._type_deserializers[value_type]
+        except KeyError:
+            deserialize = self._type_deserializers[value_type] = self._find_deserializer(value_type)
+        except TypeError:
+            # Unhashable type expressions cannot be memoized
+            deserialize = self._find_deserializer(value_type)
+        return deserialize(data)
+
+    def _find_deserializer(self, value_type: type | GenericAlias) -> Callable[[Any], Any]:
+        """Return the function `deserialize_value` applies to values of `value_type`."""
+        deserialize = self._find_registry_deserializer(value_type)
+
+        # Global NDJSON minted deserializers come first for minted constructors
+        # NOTE: They are looked up on each call, since re-minting a name can
+        # swap its deserializer without this registry hearing about it
         mint_name = get_mint_name(value_type) if callable(value_type) else None
-        if mint_name is not None and mint_name in _ndjson_deserializers:
-            return _ndjson_deserializers[mint_name](data)
+        if mint_name is not None:
+            return functools.partial(_deserialize_minted, mint_name, deserialize)
+        return deserialize
 
+    def _find_registry_deserializer(self, value_type: type | GenericAlias) -> Callable[[Any], Any]:
+        """Return the deserializer for `value_type` from this registry, ignoring mints."""
         # Check if we have a custom deserializer for this type
         type_name = getattr(value_type, '__name__', None)
 
         if type_name and type_name in self._deserializers:
-            return self._deserializers[type_name](data)
+            return self._deserializers[type_name]
 
         # For generic types, get the origin
         origin = get_origin(value_type)
@@ -314,18 +758,16 @@ class TypeRegistry:
             # For generics like list[int], just construct using the origin
             origin_name = origin.__name__
             if origin_name in self._deserializers:
-                return self._deserializers[origin_name](data)
+                return self._deserializers[origin_name]
             # Default: use the origin type constructor
-            return origin(data) if data is not None else None
+            return functools.partial(_construct, origin)
 
         # For regular types, try direct construction
         if isinstance(value_type, type):
-            if type_name and type_name in self._deserializers:
-                return self._deserializers[type_name](data)
-            return value_type(data) if data is not None else None
+            return functools.partial(_construct, value_type)
 
         # Fallback: return the data as-is
-        return data
+        return _identity
 
 
 # Global default registry
@@ -363,43 +805,32 @@ class ConjunctionSerializer:
                 "list_0": [1, 2, 3]
             }
         """
+        plan = _schema_plan(tuple(conj._data))
         result: dict[str, Any] = {
-            "__conjunction_types__": []
+            "__conjunction_types__": [
+                {"type": type_repr, "key": key} for type_repr, key in plan
+            ]
         }
 
-        # Track counts for each base type name to handle duplicates
-        type_counts: dict[str, int] = {}
-
-        # Iterate through actual type keys in the Conjunction
-        for typ in conj._data.keys():
-            # Serialize the type
-            type_repr = _serialize_type(typ)
-
-            # Generate a unique key for this value
-            # Use the base name (int, list, etc.) with a counter
-            base_name = getattr(typ, '__name__', None)
-            if base_name is None:
-                # For generic aliases, get the origin's name
-                origin = get_origin(typ)
-                base_name = origin.__name__ if origin else 'type'
-
-            count = type_counts.get(base_name, 0)
-            value_key = f"{base_name}_{count}"
-            type_counts[base_name] = count + 1
-
-            # Store type metadata
-            result["__conjunction_types__"].append({
-                "type": type_repr,
-                "key": value_key
-            })
-
-            # Serialize the value
-            value = conj._data[typ]
-            serialized_value = self.registry.serialize_value(value, typ)
-            result[value_key] = serialized_value
+        # Serialize each value under its generated key
+        serialize_value = self.registry.serialize_value
+        for (typ, value), (_, key) in zip(conj._data.items(), plan):
+            result[key] = serialize_value(value, typ)
 
         return result
 
+    def json_header(self, conj: Conjunction) -> list[dict[str, str]]:
+        """
+        Build the type metadata `to_json` stores under "__conjunction_types__".
+
+        Depends only on the Conjunction's type keys, so one header describes
+        every row of the same schema (see `to_json_positional`).
+        """
+        return [
+            {"type": type_repr, "key": key}
+            for type_repr, key in _schema_plan(tuple(conj._data))
+        ]
+
     def from_json(self, data: dict[str, Any]) -> Conjunction:
         """
         Deserialize a Conjunction from JSON.
@@ -421,22 +852,65 @@ class ConjunctionSerializer:
         # Build the Conjunction by reconstructing its internal data
         result = Conjunction.__new__(Conjunction)
         conj_data = {}
+        deserialize_type = self.registry.deserialize_type
+        deserialize_value = self.registry.deserialize_value
 
         for entry in type_metadata:
-            type_repr = entry["type"]
             value_key = entry["key"]
 
-            if value_key not in data:
-                raise ValueError(f"Missing value for key: {value_key}")
+            try:
+                serialized_value = data[value_key]
+            except KeyError:
+                raise ValueError(f"Missing value for key: {value_key}") from None
 
-            # Deserialize the type
-            typ = _deserialize_type(type_repr, self.registry._safe_globals)
+            # Deserialize the type, then the value
+            typ = deserialize_type(entry["type"])
+            conj_data[typ] = deserialize_value(serialized_value, typ)
 
-            # Deserialize the value
-            serialized_value = data[value_key]
-            value = self.registry.deserialize_value(serialized_value, typ)
+        # Set internal state
+        object.__setattr__(result, '_data', conj_data)
+        object.__setattr__(result, '_hash', None)
 
-            conj_data[typ] = value
+        return result
+
+    def to_json_positional(self, conj: Conjunction) -> list[Any]:
+        """
+        Serialize a Conjunction's values as a list, in `json_header(conj)` order.
+
+        The most compact row layout: value keys are implied by position.
+        """
+        serialize_value = self.registry.serialize_value
+        return [serialize_value(value, typ) for typ, value in conj._data.items()]
+
+    def from_json_positional(
+        self,
+        values: list[Any],
+        header: list[dict[str, str]],
+    ) -> Conjunction:
+        """
+        Deserialize a Conjunction from `to_json_positional` output.
+
+        Args:
+            values: JSON list of values, one per header entry
+            header: Type metadata from `json_header`
+
+        Returns:
+            Reconstructed Conjunction with proper type keys
+        """
+        if not header:
+            raise ValueError("Cannot create empty Conjunction")
+        if len(values) != len(header):
+            raise ValueError(f"Expected {len(header)} values, got {len(values)}")
+
+        # Build the Conjunction by reconstructing its internal data
+        result = Conjunction.__new__(Conjunction)
+        conj_data = {}
+        deserialize_type = self.registry.deserialize_type
+        deserialize_value = self.registry.deserialize_value
+
+        for entry, serialized_value in zip(header, values):
+            typ = deserialize_type(entry["type"])
+            conj_data[typ] = deserialize_value(serialized_value, typ)
 
         # Set internal state
         object.__setattr__(result, '_data', conj_data)
@@ -446,12 +920,37 @@ class ConjunctionSerializer:
 
 
 class NDJSONFile:
-    """Utilities for reading/writing NDJSON files with Conjunction instances."""
+    """
+    Utilities for reading/writing NDJSON files with Conjunction instances.
+
+    Each `append` opens and closes the file by default. For bulk appends, keep
+    the append descriptor open instead, either with `open()`/`close()` or by
+    using the file as a context manager:
+
+        with NDJSONFile("data.ndjson") as file:
+            for conj in conjunctions:
+                file.append(conj)
+
+    With `header=True`, rows are written as bare value lists without their
+    type metadata. A `{"__header__": [...]}` line is written instead whenever
+    the schema differs from the previous row this instance wrote, and
+    applies to the rows after it. `read` understands both layouts (and files mixing them)
+    whatever this flag is set to. Header mode assumes one writer per file,
+    as rows from another writer could land under the wrong header.
+
+    With `format='msgpack'` (requires `msgspec`), the same records are stored
+    as length-prefixed MessagePack instead of JSON lines, which is smaller
+    and faster to encode and decode. Integers must then fit in 64 bits.
+    """
 
     def __init__(
         self,
         path: Path | str,
         registry: TypeRegistry | None = None,
+        header: bool = False,
+        format: Literal['json', 'msgpack'] = 'json',
+        durability: Literal['none', 'fsync', 'dsync'] = 'none',
+        sync_every: int = 1,
     ) -> None:
         """
         Initialize NDJSON file handler.
@@ -459,17 +958,189 @@ class NDJSONFile:
         Args:
             path: Path to NDJSON file
             registry: Custom type registry for serialization
+            header: Write type metadata once per schema instead of per row
+            format: On-disk encoding, JSON lines or length-prefixed MessagePack
+            durability: When appends are forced to disk. 'none' leaves it to
+                the OS (records still survive a process crash, not a power
+                loss); 'fsync' syncs after every `sync_every` records appended
+                while open, and at the end of each batch, each one-shot
+                `append` and `close()`; 'dsync' opens the file with
+                `O_DSYNC`, so every write waits for the disk
+            sync_every: Appended records per fsync with durability='fsync'
         """
+        if durability not in ('none', 'fsync', 'dsync'):
+            raise ValueError(f"Unknown durability {durability!r}, expected 'none', 'fsync' or 'dsync'")
+        if durability == 'dsync' and not hasattr(os, 'O_DSYNC'):
+            raise ValueError("durability='dsync' is not supported on this platform")
+        if sync_every < 1:
+            raise ValueError("sync_every must be at least 1")
+
+        if format == 'json':
+            self._dumps, self._loads, self._iter_records = _dumps_line, _loads_line, _iter_lines
+        elif format == 'msgpack':
+            if msgpack is None:
+                raise ImportError("format='msgpack' requires msgspec: pip install msgspec")
+            self._dumps, self._loads, self._iter_records = (
+                _dumps_msgpack_record, msgpack.decode, _iter_msgpack_records
+            )
+        else:
+            raise ValueError(f"Unknown format {format!r}, expected 'json' or 'msgpack'")
+
         self.path = Path(path)
         self.serializer = ConjunctionSerializer(registry)
+        self.header = header
+        self.format = format
+        self.durability = durability
+        self.sync_every = sync_every
+        self._fd: int | None = None
+        self._header_types: tuple[Any, ...] | None = None
+        self._unsynced = 0
+
+    def _open_append(self) -> int:
+        """Open an append descriptor, creating parent directories only if missing."""
+        flags = _APPEND_FLAGS | os.O_DSYNC if self.durability == 'dsync' else _APPEND_FLAGS
+        try:
+            return os.open(self.path, flags, 0o644)
+        except FileNotFoundError:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            return os.open(self.path, flags, 0o644)
+
+    def _sync(self, fd: int, appended: int, end_of_batch: bool = False) -> None:
+        """Apply durability='fsync' after `appended` more records were written to `fd`."""
+        if self.durability != 'fsync':
+            return
+        self._unsynced += appended
+        if end_of_batch or self._unsynced >= self.sync_every:
+            os.fsync(fd)
+            self._unsynced = 0
+
+    def open(self) -> NDJSONFile:
+        """
+        Keep an `O_APPEND` descriptor open until `close()` is called.
+
+        Appends then skip reopening the file per record. Each record is still
+        written with a single unbuffered `write()`, so several processes can
+        append to the same file without locking and without tearing lines.
+
+        Returns:
+            This NDJSONFile, for chaining
+        """
+        if self._fd is None:
+            self._fd = self._open_append()
+        return self
+
+    def flush(self) -> None:
+        """
+        Force appended records to disk with `fsync` (no-op if not open).
+
+        Appends are unbuffered, so records are visible to readers as soon as
+        `append` returns; this only adds durability across a crash.
+        """
+        if self._fd is not None:
+            os.fsync(self._fd)
+            self._unsynced = 0
+
+    def close(self) -> None:
+        """Close the append descriptor opened by `open()`."""
+        if self._fd is not None:
+            if self._unsynced:
+                self._sync(self._fd, 0, end_of_batch=True)
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> NDJSONFile:
+        return self.open()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _encode(self, conj: Conjunction) -> bytes:
+        """Encode one row, preceded by a header line if the schema changed."""
+        if not self.header:
+            return self._dumps(self.serializer.to_json(conj))
+
+        line = self._dumps(self.serializer.to_json_positional(conj))
+        types = tuple(conj._data)
+        if types != self._header_types:
+            header = {"__header__": self.serializer.json_header(conj)}
+            line = self._dumps(header) + line
+            self._header_types = types
+        return line
 
     def append(self, conj: Conjunction) -> None:
         """Append a Conjunction to the NDJSON file."""
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        data = self.serializer.to_json(conj)
+        try:
+            line = self._encode(conj)
+
+            if self._fd is not None:
+                _write_line(self._fd, line)
+                self._sync(self._fd, 1)
+                return
+
+            # The descriptor is closed right away, so nothing could sync the record later
+            fd = self._open_append()
+            try:
+                _write_line(fd, line)
+                self._sync(fd, 1, end_of_batch=True)
+            finally:
+                os.close(fd)
+        except BaseException:
+            self._forget_header()
+            raise
+
+    def _forget_header(self) -> None:
+        """
+        Make the next row repeat its header line.
+
+        Called when an append fails: the header encoded for a row may never
+        have reached the file, and a positional row without it is unreadable.
+        """
+        self._header_types = None
+
+    def append_many(self, conjunctions: Iterable[Conjunction], *, fsync: bool = False) -> None:
+        """
+        Append several Conjunctions, coalescing them into ~1 MiB writes.
 
-        with open(self.path, 'a') as f:
-            f.write(json.dumps(data) + '\n')
+        Much cheaper than calling `append` per record for large batches. Each
+        write still holds whole records only, so concurrent appenders cannot
+        tear a line.
+
+        Args:
+            conjunctions: Conjunction instances to append
+            fsync: Force the appended records to disk before returning
+        """
+        one_shot = self._fd is None
+        if one_shot:
+            fd = self._open_append()
+        else:
+            fd = self._fd
+
+        try:
+            for chunk in self._encode_chunks(conjunctions):
+                _write_line(fd, chunk)
+            if fsync:
+                os.fsync(fd)
+                self._unsynced = 0
+            else:
+                self._sync(fd, 0, end_of_batch=True)
+        except BaseException:
+            self._forget_header()
+            raise
+        finally:
+            if one_shot:
+                os.close(fd)
+
+    def _encode_chunks(self, conjunctions: Iterable[Conjunction]) -> Iterator[bytearray]:
+        """Encode rows and yield them in buffers of about `_WRITE_CHUNK_SIZE` bytes."""
+        encode = self._encode
+        buffer = bytearray()
+        for conj in conjunctions:
+            buffer += encode(conj)
+            if len(buffer) >= _WRITE_CHUNK_SIZE:
+                yield buffer
+                buffer = bytearray()
+        if buffer:
+            yield buffer
 
     def read(self) -> Iterator[Conjunction]:
         """
@@ -481,34 +1152,55 @@ class NDJSONFile:
         if not self.path.exists():
             return
 
-        with open(self.path) as f:
-            for line in f:
-                if line.strip():  # Skip empty lines
-                    data = json.loads(line)
+        header = None
+        with open(self.path, 'rb') as f:
+            for line in self._iter_records(f):  # Skips empty lines
+                data = self._loads(line)
+                if data.__class__ is list:
+                    if header is None:
+                        raise ValueError("Positional row before any header line")
+                    yield self.serializer.from_json_positional(data, header)
+                elif "__header__" in data:
+                    header = data["__header__"]
+                else:
                     yield self.serializer.from_json(data)
 
-    def read_raw(self) -> Iterator[dict[str, Any]]:
+    def read_raw(self) -> Iterator[dict[str, Any] | list[Any]]:
         """
         Read raw JSON dicts from NDJSON file.
 
         Yields:
-            Raw dict objects without deserialization
+            Raw dict objects without deserialization (header lines included;
+            rows written in header mode are value lists)
         """
         if not self.path.exists():
             return
 
-        with open(self.path) as f:
-            for line in f:
-                if line.strip():
-                    yield json.loads(line)
+        with open(self.path, 'rb') as f:
+            for line in self._iter_records(f):
+                yield self._loads(line)
 
     def count_lines(self) -> int:
-        """Count number of lines in NDJSON file."""
+        """Count number of lines (records, for MessagePack) in the file, header lines included."""
         if not self.path.exists():
             return 0
 
-        with open(self.path) as f:
-            return sum(1 for line in f if line.strip())
+        with open(self.path, 'rb') as f:
+            if self.format != 'json':
+                return sum(1 for _ in self._iter_records(f))
+
+            # Counting newline bytes per chunk is exact as long as no line is
+            # blank; lines this module writes never start with whitespace, so
+            # only fall back to splitting when one does
+            count = 0
+            last = b'\n'
+            while chunk := f.read(_READ_CHUNK_SIZE):
+                if (last == b'\n' and chunk[:1].isspace()) or _MAYBE_BLANK_LINE.search(chunk):
+                    f.seek(0)
+                    return sum(1 for _ in _iter_lines(f))
+                count += chunk.count(b'\n')
+                last = chunk[-1:]
+            return count if last == b'\n' else count + 1
 
     def write_all(self, conjunctions: list[Conjunction]) -> None:
         """
@@ -517,9 +1209,22 @@ class NDJSONFile:
         Args:
             conjunctions: List of Conjunction instances to write
         """
-        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write ~1 MiB chunks of encoded lines rather than one write call per
+        # record
+        self._header_types = None
+        try:
+            f = open(self.path, 'wb')
+        except FileNotFoundError:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(self.path, 'wb')
 
-        with open(self.path, 'w') as f:
-            for conj in conjunctions:
-                data = self.serializer.to_json(conj)
-                f.write(json.dumps(data) + '\n')
+        try:
+            with f:
+                for chunk in self._encode_chunks(conjunctions):
+                    f.write(chunk)
+                if self.durability != 'none':
+                    f.flush()
+                    os.fsync(f.fileno())
+        except BaseException:
+            self._forget_header()
+            raise
@@ -75,6 +75,30 @@ class TestTypeEquivalence:
         assert Conjunction[Conjunction[int | Conjunction[dict[str, int]]] & bool] == \
                Conjunction[int | dict[str, int] | bool]
 
+    def test_type_identity_and_clear_cache(self):
+        """Equal type sets should share one class until the cache is cleared"""
+        before = Conjunction[int | str]
+        assert Conjunction[str | int] is before
+
+        Conjunction.clear_cache()
+        after = Conjunction[int | str]
+        assert after is not before
+        assert after == before
+
+    def test_type_cache_is_bounded(self, monkeypatch):
+        """The type cache should flush at its size limit without breaking equality"""
+        from conjunction_types import _core
+
+        Conjunction.clear_cache()
+        monkeypatch.setattr(_core, '_CACHE_MAX', 2)
+        first = Conjunction[int]
+        Conjunction[str]
+        Conjunction[float]
+
+        assert len(_core.ConjunctionMeta._cache) <= 2
+        assert Conjunction[int] == first
+        assert isinstance(Conjunction(1), first)
+
 
 class TestTypeConstruction:
     """Test type construction with getitem."""
@@ -95,6 +119,23 @@ class TestTypeConstruction:
         with pytest.raises(KeyError):
             str_int_instance[bool]
 
+    def test_ellipsis_type_normalizes_open(self):
+        """type(...) is a class, but should normalize to the open type set"""
+        from conjunction_types import _core
+
+        assert _core._normalize_union(type(...)) == frozenset()
+        assert _core._normalize_union(int) == frozenset({int})
+
+    def test_ellipsis_type_subscript_is_open(self):
+        """Conjunction[type(...)] should be the open Conjunction, like Conjunction[...]"""
+        assert Conjunction[type(...)] is Conjunction
+        assert Conjunction[...] is Conjunction
+
+    def test_ellipsis_type_in_tuple_subscript(self):
+        """type(...) inside a tuple subscript should be dropped, not become a component"""
+        assert Conjunction[int, type(...)] == Conjunction[int]
+        assert Conjunction[type(...), type(...)] is Conjunction
+
 
 class TestTypeConcatenation:
     """Test associative type concatenation."""
@@ -151,6 +192,39 @@ class TestDerivedTypes:
 
         assert types_found == {float, int, str, bool}
 
+    def test_subclass_subscript_gives_generated_type(self):
+        """Subscripting with a user subclass should give the generated type, not the subclass"""
+        class Sub(Conjunction[int]):
+            pass
+
+        assert Conjunction[Sub] is Conjunction[int]
+        assert type(Conjunction[Sub](5)) is Conjunction[int]
+
+    def test_subclass_projection_gives_generated_type(self):
+        """Projecting a user subclass onto its own types should not return the subclass"""
+        class Sub(Conjunction[int]):
+            pass
+
+        assert Sub[int] is Conjunction[int]
+        assert Sub[int,] is Conjunction[int]
+        assert Conjunction[int][int] is Conjunction[int]
+
+        obj = Sub(5)
+        assert type(obj[int | int]) is Conjunction
+        assert type(obj / str) is Conjunction
+        assert obj / str == obj
+
+    def test_subclass_conjunction_gives_generated_type(self):
+        """Type-level & with a user subclass should give the generated type"""
+        class Sub(Conjunction[int]):
+            pass
+
+        assert Sub & Conjunction[int] is Conjunction[int]
+        assert Conjunction[int] & Sub is Conjunction[int]
+        assert Sub & int is Conjunction[int]
+        assert int & Sub is Conjunction[int]
+        assert Conjunction & Conjunction is Conjunction
+
 
 class TestInstanceConstruction:
     """Test creating instances with type inference."""
@@ -163,6 +237,24 @@ class TestInstanceConstruction:
         assert str in float_int_str
         assert float in float_int_str
 
+    def test_keyword_construction(self):
+        """Should resolve type names given as keywords"""
+        obj = Conjunction(int=5, str="hello", float=0.5)
+
+        assert obj == Conjunction(5, "hello", 0.5)
+        with pytest.raises(TypeError):
+            Conjunction(not_a_type=5)
+
+    def test_keyword_construction_with_mint_names(self):
+        """Minted type names should work as keywords, so repr() output round-trips"""
+        from conjunction_types import mint
+
+        Scores = mint("Scores_Keyword", list[int])
+        obj = Conjunction(Scores([1, 2]), 3)
+
+        assert repr(obj) == "Conjunction(Scores_Keyword=[1, 2], int=3)"
+        assert Conjunction(Scores_Keyword=[1, 2], int=3) == obj
+
 
 class TestTypeExtraction:
     """Test extracting values from instances."""
@@ -184,6 +276,15 @@ class TestTypeExtraction:
         assert int_val == 5
         assert str_val == "hello"
 
+    def test_ellipsis_type_extraction(self):
+        """Indexing by type(...) should select nothing, like an open type"""
+        assert Conjunction(5, "hello")[type(...)] == Conjunction()
+
+    def test_ellipsis_type_membership(self):
+        """type(...) names no types, so every instance contains it"""
+        assert type(...) in Conjunction(5)
+        assert type(...) in Conjunction()
+
 
 class TestPartialExtraction:
     """Test partial type extraction returning Conjunction."""
@@ -235,6 +336,16 @@ class TestConjunctionOperator:
         assert result.to(float) == 1.0
         assert result.to(int) == 42
 
+    def test_idempotent_merge_reuses_instance(self):
+        """Merging bindings that are already present should return the left operand"""
+        text = "hello"
+        obj = Conjunction(5, text)
+
+        with pytest.warns(UserWarning):
+            assert (obj & Conjunction(text)) is obj
+        with pytest.warns(UserWarning):
+            assert (obj & Conjunction("hell" + "o".upper())).to(str) == "hellO"
+
 
 class TestInstanceTypeChecking:
     """Test type membership on instances."""
@@ -290,6 +401,16 @@ class TestIteration:
 
         assert len(items_found) == 3
 
+    def test_repeated_iteration_reuses_wrappers(self):
+        """values() and items() should hand back the same wrappers on every pass"""
+        float_int_str = Conjunction(5, "hello", 0.5)
+
+        values = list(float_int_str.values())
+        assert list(float_int_str.values()) == values
+        assert all(a is b for a, b in zip(float_int_str.values(), values))
+        assert [value for _, value in float_int_str.items()] == values
+        assert [value.to(typ) for typ, value in float_int_str.items()] == [5, "hello", 0.5]
+
 
 class TestHashability:
     """Test that instances are hashable."""
@@ -342,6 +463,14 @@ class TestImmutability:
         with pytest.raises(TypeError):
             del obj._data
 
+    def test_no_instance_dict(self):
+        """Instances of parameterized types should not carry a __dict__"""
+        obj = Conjunction[int | str](5, "hello")
+
+        assert not hasattr(obj, '__dict__')
+        with pytest.raises(TypeError):
+            obj.new_attr = "value"
+
     def test_no_reinitialization(self):
         """Should not allow re-initialization"""
         obj = Conjunction(5, "hello", 0.5)
@@ -349,6 +478,24 @@ class TestImmutability:
         with pytest.raises(TypeError):
             obj.__init__(10, "world", 1.5)
 
+    def test_no_reinitialization_optimized(self):
+        """The re-initialization guard should hold under python -O too"""
+        import subprocess
+        import sys
+
+        # assert is compiled out under -O, so the result is reported through the exit code
+        code = (
+            "import sys\n"
+            "from conjunction_types import Conjunction\n"
+            "obj = Conjunction(5)\n"
+            "try:\n"
+            "    obj.__init__(99)\n"
+            "except TypeError:\n"
+            "    sys.exit(0 if obj.to(int) == 5 else 1)\n"
+            "sys.exit(1)\n"
+        )
+        subprocess.run([sys.executable, "-O", "-c", code], check=True)
+
 
 class TestSetDifference:
     """Test the bonus set difference operation."""
@@ -435,6 +582,14 @@ class TestIsInstanceAndIsSubclass:
         obj = Conjunction(5, 0.5)
         assert isinstance(obj, Conjunction)
 
+    def test_isinstance_exact_types(self):
+        """Instances should match only the Conjunction type with exactly their types"""
+        obj = Conjunction(5, 0.5)
+        assert isinstance(obj, Conjunction[float | int])
+        assert not isinstance(obj, Conjunction[float])
+        assert not isinstance(obj, Conjunction[float | int | str])
+        assert not isinstance(5, Conjunction[int])
+
     def test_issubclass_subset(self):
         """Subset should be subclass of superset"""
         FloatInt = Conjunction[float | int]
@@ -264,6 +264,103 @@ class TestTypeRegistry:
         assert 'CustomType' in registry._safe_globals
         assert registry._safe_globals['CustomType'] is CustomType
 
+    def test_runtime_type_serializer_lookup(self):
+        """Serializers registered for a base class should apply to subclass values."""
+
+        class Base:
+            pass
+
+        class Sub(Base):
+            pass
+
+        registry = TypeRegistry()
+        with pytest.raises(TypeError, match="not JSON-serializable"):
+            registry.serialize_value(Sub(), object)
+
+        registry.register(Base, serializer=lambda v: 'base', deserializer=lambda d: Base())
+        assert registry.serialize_value(Sub(), object) == 'base'
+        assert registry.serialize_value(Sub(), object) == 'base'
+
+    def test_deserialize_type_sees_later_registrations(self):
+        """Memoized type lookups should be invalidated by new registrations."""
+
+        class LateType:
+            pass
+
+        registry = TypeRegistry()
+        assert registry.deserialize_type('list[int]') == list[int]
+        with pytest.raises(ValueError, match="Cannot deserialize type"):
+            registry.deserialize_type('LateType')
+
+        registry.register_type('LateType', LateType)
+        assert registry.deserialize_type('LateType') is LateType
+        assert registry.deserialize_type('list[LateType]') == list[LateType]
+
+    def test_deserializer_lookup_sees_later_registrations(self):
+        """Memoized deserializer lookups should be invalidated by new registrations."""
+        registry = TypeRegistry()
+        assert registry.deserialize_value('a', str) == 'a'
+        assert registry.deserialize_value(None, int) is None
+
+        registry.register(str, serializer=str, deserializer=str.upper)
+        assert registry.deserialize_value('a', str) == 'A'
+
+    def test_failing_deserializer_called_once(self):
+        """A deserializer raising KeyError/TypeError should not be re-run."""
+        calls = []
+
+        def failing(data):
+            calls.append(data)
+            raise KeyError(data)
+
+        registry = TypeRegistry()
+        registry.register(str, serializer=str, deserializer=failing)
+        for _ in range(3):
+            with pytest.raises(KeyError):
+                registry.deserialize_value('a', str)
+        assert len(calls) == 3
+
+        with pytest.raises(TypeError):
+            registry.deserialize_value([1], int)
+
+    def test_deserialize_type_representations(self):
+        """Every shape of type representation should decode to the type it came from."""
+        registry = TypeRegistry()
+        for typ in (
+            int, Path, dict[str, list[int]], list[int | None],
+            tuple[int, ...], tuple[()],
+        ):
+            type_repr = ConjunctionSerializer(registry).json_header(
+                _make_conjunction_with_types({typ: None})
+            )[0]['type']
+            assert registry.deserialize_type(type_repr) == typ
+
+        with pytest.raises(ValueError, match="Cannot deserialize type"):
+            registry.deserialize_type('list[int')
+
+    def test_type_repr_cache_is_bounded(self, monkeypatch):
+        """The type representation memo should flush at its size limit."""
+        from conjunction_types.ndjson import utils
+
+        monkeypatch.setattr(utils, '_type_repr_cache', {})
+        monkeypatch.setattr(utils, '_CACHE_MAX', 2)
+        for typ, type_repr in (
+            (int, 'int'), (list[int], 'list[int]'), (dict[str, int], 'dict[str, int]'), (int, 'int'),
+        ):
+            assert utils._serialize_type(typ) == type_repr
+        assert len(utils._type_repr_cache) <= 2
+
+    def test_schema_plan_cache_is_bounded(self, monkeypatch):
+        """The per-schema plan memo should flush at its size limit."""
+        from conjunction_types.ndjson import utils
+
+        monkeypatch.setattr(utils, '_schema_plan_cache', {})
+        monkeypatch.setattr(utils, '_CACHE_MAX', 2)
+        serializer = ConjunctionSerializer()
+        for conj in (Conjunction(1), Conjunction('a'), Conjunction(1, 'a'), Conjunction(1)):
+            assert serializer.from_json(serializer.to_json(conj)) == conj
+        assert len(utils._schema_plan_cache) <= 2
+
 
 class TestConjunctionSerializer:
     """Test ConjunctionSerializer directly."""
@@ -352,6 +449,191 @@ class TestNDJSONFile:
         finally:
             Path(tmp_path).unlink(missing_ok=True)
 
+    def test_context_manager_appends(self):
+        """Appends through an open handle should be readable, before and after close."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'nested' / 'data.ndjson'
+
+            with NDJSONFile(path) as file:
+                file.append(Conjunction(1, 'a'))
+                file.append(Conjunction(2, 'b'))
+                # Appends are unbuffered, so readers see them immediately
+                assert file.count_lines() == 2
+
+                file.append(Conjunction(3, 'c'))
+
+            assert file._fd is None
+            results = list(NDJSONFile(path).read())
+            assert [c.to(int) for c in results] == [1, 2, 3]
+
+            # Without an open handle, appends still work one-shot
+            file.append(Conjunction(4, 'd'))
+            assert file.count_lines() == 4
+
+    def test_append_many(self):
+        """Bulk appends should land after existing rows, with or without an open handle."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'nested' / 'data.ndjson'
+            file = NDJSONFile(path)
+
+            file.append(Conjunction(0, 'a'))
+            file.append_many((Conjunction(i, 'a') for i in range(1, 3)), fsync=True)
+            with file:
+                file.append_many([Conjunction(3, 'a')])
+
+            assert [c.to(int) for c in file.read()] == [0, 1, 2, 3]
+
+    def test_msgpack_format_roundtrip(self):
+        """MessagePack files should roundtrip rows, including newline bytes and header mode."""
+        pytest.importorskip("msgspec")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'data.mpk'
+            rows = [Conjunction(10, 'a\nb'), Conjunction('x' * 300, [1.5])]
+
+            for header in (False, True):
+                file = NDJSONFile(path, header=header, format='msgpack')
+                file.write_all(rows)
+                file.append_many(rows)
+
+                assert list(file.read()) == rows * 2
+                # The two schemas alternate, so header mode repeats its header line
+                assert file.count_lines() == (8 if header else 4)
+
+        with pytest.raises(ValueError, match="Unknown format"):
+            NDJSONFile(path, format='xml')
+
+    def test_records_spanning_read_chunks(self, monkeypatch):
+        """Records longer than a read chunk should be reassembled intact."""
+        from conjunction_types.ndjson import utils
+
+        monkeypatch.setattr(utils, '_READ_CHUNK_SIZE', 16)
+        rows = [Conjunction(1), Conjunction('x' * 100, [2.5]), Conjunction(3)]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'data.ndjson'
+            file = NDJSONFile(path)
+            file.write_all(rows)
+
+            assert list(file.read()) == rows
+            assert file.count_lines() == 3
+
+    def test_msgpack_records_spanning_read_chunks(self, monkeypatch):
+        """MessagePack records longer than a read chunk should be reassembled intact."""
+        from conjunction_types.ndjson import utils
+
+        pytest.importorskip("msgspec")
+        monkeypatch.setattr(utils, '_READ_CHUNK_SIZE', 16)
+        rows = [Conjunction(1), Conjunction('x' * 100, [2.5]), Conjunction(3)]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'data.mpk'
+            file = NDJSONFile(path, format='msgpack')
+            file.write_all(rows)
+
+            assert list(file.read()) == rows
+            assert file.count_lines() == 3
+
+            # A record cut off at end of file is an error, not a silent drop
+            with open(path, 'rb+') as f:
+                f.truncate(path.stat().st_size - 1)
+            with pytest.raises(ValueError, match="Truncated"):
+                list(file.read())
+
+    def test_durability_fsync_batches(self, monkeypatch):
+        """durability='fsync' should sync once per sync_every appends, and on close."""
+        import os
+
+        synced = []
+        monkeypatch.setattr(os, 'fsync', synced.append)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'data.ndjson'
+            with NDJSONFile(path, durability='fsync', sync_every=2) as file:
+                for i in range(5):
+                    file.append(Conjunction(i))
+                assert len(synced) == 2
+            assert len(synced) == 3
+
+            # One-shot appends close their descriptor, so each syncs before returning
+            file = NDJSONFile(path, durability='fsync', sync_every=2)
+            file.append(Conjunction(5))
+            assert len(synced) == 4
+
+            # flush() restarts the count, so the next sync waits for sync_every records
+            with file:
+                file.append(Conjunction(6))
+                file.flush()
+                assert len(synced) == 5
+                file.append(Conjunction(7))
+                assert len(synced) == 5
+                file.append(Conjunction(8))
+                assert len(synced) == 6
+
+            NDJSONFile(path, durability='dsync').append(Conjunction(9))
+            assert [c.to(int) for c in file.read()] == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+        with pytest.raises(ValueError, match="Unknown durability"):
+            NDJSONFile(path, durability='always')
+
+    def test_count_lines_skips_blank_lines(self):
+        """Blank lines and a missing trailing newline should not skew the count."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'data.ndjson'
+            file = NDJSONFile(path)
+
+            path.write_bytes(b'{"a": 1}\n{"a": 2}')
+            assert file.count_lines() == 2
+
+            path.write_bytes(b'\n{"a": 1}\n  \r\n\n{"a": 2}\n')
+            assert file.count_lines() == 2
+
+    def test_header_mode_roundtrip(self):
+        """Header mode should write metadata once per schema and read back the same rows."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'data.ndjson'
+            file = NDJSONFile(path, header=True)
+
+            file.write_all([Conjunction(1, 'a'), Conjunction(2, 'b')])
+            file.append(Conjunction(3, 'c'))
+            file.append(_make_conjunction_with_types({list[int]: [1, 2]}))
+
+            raw = list(file.read_raw())
+            assert [r if isinstance(r, list) else list(r) for r in raw] == [
+                ['__header__'], [1, 'a'], [2, 'b'], [3, 'c'],
+                ['__header__'], [[1, 2]],
+            ]
+
+            # Any reader decodes it, and rows with inline metadata mix in fine
+            NDJSONFile(path).append(Conjunction(4.5))
+            results = list(NDJSONFile(path).read())
+            assert [c.to(int) for c in results[:3]] == [1, 2, 3]
+            assert list[int] in results[3]
+            assert results[4].to(float) == 4.5
+
+    def test_header_repeated_after_failed_append(self, monkeypatch):
+        """A header encoded for rows that were never written should be written again."""
+        import os
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'data.ndjson'
+            file = NDJSONFile(path, header=True)
+
+            with pytest.raises(TypeError):
+                file.append_many([Conjunction(1, 'a'), Conjunction(object())])
+            file.append(Conjunction(2, 'b'))
+
+            def no_space(fd, data):
+                raise OSError(28, 'No space left on device')
+
+            with monkeypatch.context() as patch:
+                patch.setattr(os, 'write', no_space)
+                with pytest.raises(OSError):
+                    file.append(Conjunction(3.5))
+            file.append(Conjunction(4.5))
+
+            assert [list(c) for c in file.read()] == [[int, str], [float]]
+
     def test_nonexistent_file_read(self):
         """Reading from nonexistent file should return empty iterator."""
         file = NDJSONFile('/nonexistent/path/file.ndjson')
@@ -384,6 +666,37 @@ class TestNDJSONFile:
         finally:
             Path(tmp_path).unlink(missing_ok=True)
 
+    def test_values_outside_fast_encoder_roundtrip(self):
+        """NaN, big integers, None and non-ASCII text should survive a roundtrip."""
+        import math
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.ndjson', delete=False) as f:
+            tmp_path = f.name
+
+        try:
+            file = NDJSONFile(tmp_path)
+            file.append(Conjunction(float('nan'), 2 ** 100 + 1, 'héllo'))
+            file.append(_make_conjunction_with_types({list: [None, 1, 2 ** 70 + 3]}))
+
+            results = list(file.read())
+
+            assert math.isnan(results[0].to(float))
+            assert results[0].to(int) == 2 ** 100 + 1
+            assert results[0].to(str) == 'héllo'
+            assert results[1].to(list) == [None, 1, 2 ** 70 + 3]
+            assert list(file.read_raw())[1]['list_0'] == [None, 1, 2 ** 70 + 3]
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
+
+    def test_none_and_null_text_use_fast_encoder(self):
+        """Only non-finite floats, not None or 'null' text, should force the stdlib encoder."""
+        from conjunction_types.ndjson import utils
+
+        pytest.importorskip('orjson')
+        row = {'list_0': [None, 'null'], 'float_0': [1.5, {'x': 2.0}]}
+        assert utils._dumps_line(row) == b'{"list_0":[null,"null"],"float_0":[1.5,{"x":2.0}]}\n'
+        assert utils._dumps_line({'float_0': [1.0, float('inf')]}) == b'{"float_0": [1.0, Infinity]}\n'
+
 
 class TestMint:
     """Test the mint() function for type registration."""
@@ -487,6 +800,18 @@ class TestMint:
 
         assert MyList1 is MyList2
 
+    def test_mint_deserializer_replaced_after_use(self):
+        """Re-minting a name with a new deserializer should apply to later reads."""
+        from conjunction_types.ndjson import mint
+
+        Tags = mint('Tags_Redeserialize', list[str])
+        serializer = ConjunctionSerializer()
+        data = serializer.to_json(Conjunction(Tags(['b', 'a'])))
+        assert serializer.from_json(data).to(Tags) == ['b', 'a']
+
+        mint('Tags_Redeserialize', list[str], deserializer=sorted)
+        assert serializer.from_json(data).to(Tags) == ['a', 'b']
+
     def test_mint_same_type_different_names_allowed(self):
         """Test that registering the same type with different names is allowed.
 
@@ -513,6 +838,23 @@ class TestMint:
         with pytest.raises(ValueError, match="already registered"):
             mint('SharedName', list[str])
 
+    def test_mint_tag_released_with_value(self):
+        """Test that weakrefable minted values are untagged once collected."""
+        from conjunction_types import get_minted_type
+        from conjunction_types._mint import _minted_values
+        from conjunction_types.ndjson import mint
+
+        class Point:
+            pass
+
+        PointType = mint('ReleasedPoint', Point)
+        point = PointType()
+        point_id = id(point)
+        assert get_minted_type(point) is PointType
+
+        del point
+        assert point_id not in _minted_values
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -557,6 +899,18 @@ class TestEdgeCases:
         with pytest.raises(TypeError, match="not JSON-serializable"):
             serializer.to_json(c)
 
+    def test_nested_non_json_serializable_value(self):
+        """Non-JSON values nested inside containers should raise TypeError."""
+        serializer = ConjunctionSerializer()
+
+        with pytest.raises(TypeError, match="not JSON-serializable"):
+            serializer.to_json(Conjunction([1, {'a': object()}]))
+
+        circular = []
+        circular.append(circular)
+        with pytest.raises(TypeError, match="not JSON-serializable"):
+            serializer.to_json(Conjunction(circular))
+
     def test_unknown_type_deserialization(self):
         """Unknown types in deserialization should raise ValueError."""
         serializer = ConjunctionSerializer()